@@ -0,0 +1,13 @@
+import os
+
+# Load environment variables once; every module imports the limits from here.
+# Skip the .env lookup (and importing dotenv) only when every setting read below
+# is already in the environment; otherwise .env could silently lose e.g. SNAPSHOT_PATH.
+_SETTINGS = ('MAX_NUMBER_OF_PROJECTS', 'MAX_NUMBER_OF_TASKS_PER_PROJECT', 'SNAPSHOT_PATH')
+if not all(name in os.environ for name in _SETTINGS):
+    from dotenv import load_dotenv
+    load_dotenv()
+MAX_NUMBER_OF_PROJECTS = int(os.getenv('MAX_NUMBER_OF_PROJECTS', 10))
+MAX_NUMBER_OF_TASKS_PER_PROJECT = int(os.getenv('MAX_NUMBER_OF_TASKS_PER_PROJECT', 50))
+# Optional snapshot file (.json or pickle); empty keeps the manager purely in-memory.
+SNAPSHOT_PATH = os.getenv('SNAPSHOT_PATH', '')
@@ -1,109 +1,163 @@
 import os
+import sys
+from datetime import datetime, timezone
 from services.project_manager import ProjectManager
+from persistence import check_writable
 from exceptions import ToDoError
-from dotenv import load_dotenv
+from config import MAX_NUMBER_OF_PROJECTS, MAX_NUMBER_OF_TASKS_PER_PROJECT, SNAPSHOT_PATH
 
-load_dotenv()
-MAX_NUMBER_OF_PROJECTS = os.getenv('MAX_NUMBER_OF_PROJECTS')
-MAX_NUMBER_OF_TASKS_PER_PROJECT = os.getenv('MAX_NUMBER_OF_TASKS_PER_PROJECT')
+def format_timestamp(ns: int) -> str:
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+_MENU_LINES = (
+    '=== ToDoList CLI ===',
+    '1. Create project',
+    '2. List projects',
+    '3. Delete project',
+    '4. Add task to project',
+    '5. List tasks in a project',
+    '6. Remove task from project',
+    '7. Update task (title/description/deadline/status)',
+    '8. Change task status',
+    '9. Update project (name/description)',
+    '10. Exit',
+)
+_MENU = '\n'.join(_MENU_LINES) + '\n'
 
 def print_menu():
-    print('=== ToDoList CLI ===')
-    print('1. Create project')
-    print('2. List projects')
-    print('3. Delete project')
-    print('4. Add task to project')
-    print('5. List tasks in a project')
-    print('6. Remove task from project')
-    print('7. Update task (title/description/deadline/status)')
-    print('8. Change task status')
-    print('9. Update project (name/description)')
-    print('10. Exit')
+    sys.stdout.write(_MENU)
+
+def _create_project(manager: ProjectManager):
+    # The service strips names, titles and deadlines itself.
+    name = input('Project name: ')
+    desc = input('Description (optional): ').strip()
+    manager.create_project(name, desc)
+    print('Project created.')
+
+def _list_projects(manager: ProjectManager):
+    projs = manager.list_projects()
+    if not projs:
+        print('No projects.')
+    else:
+        lines = [f"- {p.name} (tasks: {len(p.tasks)}) - {p.description}" for p in projs]
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+def _delete_project(manager: ProjectManager):
+    name = input('Project name to delete: ').strip()
+    manager.delete_project(name)
+    print('Project deleted.')
+
+def _add_task(manager: ProjectManager):
+    pname = input('Project name: ').strip()
+    title = input('Task title: ')
+    desc = input('Description: ').strip()
+    deadline = input('Deadline YYYY-MM-DD: ')
+    status = input('Status (todo|doing|done) [default todo]: ').strip() or 'todo'
+    manager.add_task_to_project(pname, title, desc, deadline, status)
+    print('Task added.')
+
+_TASK_LINE = '- %s | status: %s | created: %s | deadline: %s'
+
+def _list_tasks(manager: ProjectManager):
+    pname = input('Project name: ').strip()
+    proj = manager.get_project(pname)
+    if not proj.tasks:
+        print('No tasks.')
+    else:
+        lines = [
+            _TASK_LINE % (t.title, t.status, format_timestamp(t.created_at), t.deadline)
+            for t in proj.tasks.values()
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+def _remove_task(manager: ProjectManager):
+    pname = input('Project name: ').strip()
+    ttitle = input('Task title to remove: ').strip()
+    manager.remove_task_from_project(pname, ttitle)
+    print('Task removed.')
+
+def _update_task(manager: ProjectManager):
+    pname = input('Project name: ').strip()
+    ttitle = input('Task title to update: ').strip()
+    proj = manager.get_project(pname)
+    task = proj.get_task(ttitle)
+    new_title = input(f'New title (leave empty to keep "{task.title}"): ')
+    new_desc = input('New description (leave empty to keep current): ').strip()
+    new_deadline = input(f'New deadline YYYY-MM-DD (leave empty to keep {task.deadline}): ')
+    new_status = input(f'New status (todo|doing|done) (leave empty to keep {task.status}): ').strip()
+    manager.update_task_on(
+        proj, ttitle,
+        new_title=new_title or None,
+        new_description=new_desc or None,
+        new_deadline=new_deadline or None,
+        new_status=new_status or None
+    )
+    print('Task updated.')
+
+def _change_task_status(manager: ProjectManager):
+    pname = input('Project name: ').strip()
+    ttitle = input('Task title to change status: ').strip()
+    proj = manager.get_project(pname)
+    task = proj.get_task(ttitle)
+    print(f'Current status: {task.status}')
+    new_status = input('New status (todo|doing|done) [default todo]: ').strip() or 'todo'
+    manager.update_task_on(proj, ttitle, new_status=new_status)
+    print(f'Task "{task.title}" status changed to {task.status}.')
+
+def _update_project(manager: ProjectManager):
+    current_name = input('Current project name: ').strip()
+    proj = manager.get_project(current_name)
+    print(f'Current name: {proj.name}')
+    print(f'Current description: {proj.description}')
+    new_name = input('New project name (leave empty to keep current): ')
+    new_desc = input('New description (leave empty to keep current): ').strip()
+    manager.update_project(
+        current_name,
+        new_name=new_name or None,
+        new_description=new_desc or None
+    )
+    print('Project updated.')
+
+def _exit(manager: ProjectManager):
+    print('Exit. Goodbye!')
+    return False
+
+# Menu choice -> handler; a handler returning False ends the loop.
+_HANDLERS = {
+    '1': _create_project,
+    '2': _list_projects,
+    '3': _delete_project,
+    '4': _add_task,
+    '5': _list_tasks,
+    '6': _remove_task,
+    '7': _update_task,
+    '8': _change_task_status,
+    '9': _update_project,
+    '10': _exit,
+}
 
 def cli_loop(manager: ProjectManager):
+    _in = sys.stdin.readline
+    _out = sys.stdout.write
+    _flush = sys.stdout.flush
     while True:
         print_menu()
-        choice = input('Select an option (number): ').strip()
+        _out('Select an option (number): ')
+        _flush()
+        line = _in()
+        if not line:
+            # EOF on stdin (e.g. end of piped input): leave like option 10 does.
+            _out('\n')
+            _exit(manager)
+            break
+        choice = line.strip()
+        handler = _HANDLERS.get(choice)
+        if handler is None:
+            print('Invalid selection.')
+            continue
         try:
-            if choice == '1':
-                name = input('Project name: ').strip()
-                desc = input('Description (optional): ').strip()
-                manager.create_project(name, desc)
-                print('Project created.')
-            elif choice == '2':
-                projs = manager.list_projects()
-                if not projs:
-                    print('No projects.')
-                else:
-                    for p in projs:
-                        print(f"- {p.name} (tasks: {len(p.tasks)}) - {p.description}")
-            elif choice == '3':
-                name = input('Project name to delete: ').strip()
-                manager.delete_project(name)
-                print('Project deleted.')
-            elif choice == '4':
-                pname = input('Project name: ').strip()
-                title = input('Task title: ').strip()
-                desc = input('Description: ').strip()
-                deadline = input('Deadline YYYY-MM-DD: ').strip()
-                status = input('Status (todo|doing|done) [default todo]: ').strip() or 'todo'
-                manager.add_task_to_project(pname, title, desc, deadline, status)
-                print('Task added.')
-            elif choice == '5':
-                pname = input('Project name: ').strip()
-                proj = manager.get_project(pname)
-                if not proj.tasks:
-                    print('No tasks.')
-                else:
-                    for t in proj.tasks:
-                        print(f"- {t.title} | status: {t.status} | created: {t.created_at} | deadline: {t.deadline}")
-            elif choice == '6':
-                pname = input('Project name: ').strip()
-                ttitle = input('Task title to remove: ').strip()
-                manager.remove_task_from_project(pname, ttitle)
-                print('Task removed.')
-            elif choice == '7':
-                pname = input('Project name: ').strip()
-                ttitle = input('Task title to update: ').strip()
-                task = manager.get_project(pname).get_task(ttitle)
-                new_title = input(f'New title (leave empty to keep "{task.title}"): ').strip()
-                new_desc = input('New description (leave empty to keep current): ').strip()
-                new_deadline = input(f'New deadline YYYY-MM-DD (leave empty to keep {task.deadline}): ').strip()
-                new_status = input(f'New status (todo|doing|done) (leave empty to keep {task.status}): ').strip()
-                manager.update_task(
-                    pname, ttitle,
-                    new_title=new_title or None,
-                    new_description=new_desc or None,
-                    new_deadline=new_deadline or None,
-                    new_status=new_status or None
-                )
-                print('Task updated.')
-            elif choice == '8':
-                pname = input('Project name: ').strip()
-                ttitle = input('Task title to change status: ').strip()
-                task = manager.get_project(pname).get_task(ttitle)
-                print(f'Current status: {task.status}')
-                new_status = input('New status (todo|doing|done) [default todo]: ').strip() or 'todo'
-                manager.update_task(pname, ttitle, new_status=new_status)
-                print(f'Task "{task.title}" status changed to {task.status}.')
-            elif choice == '9':
-                current_name = input('Current project name: ').strip()
-                proj = manager.get_project(current_name)
-                print(f'Current name: {proj.name}')
-                print(f'Current description: {proj.description}')
-                new_name = input('New project name (leave empty to keep current): ').strip()
-                new_desc = input('New description (leave empty to keep current): ').strip()
-                manager.update_project(
-                    current_name,
-                    new_name=new_name or None,
-                    new_description=new_desc or None
-                )
-                print('Project updated.')
-            elif choice == '10':
-                print('Exit. Goodbye!')
+            if handler(manager) is False:
                 break
-            else:
-                print('Invalid selection.')
         except ToDoError as e:
             print('Error:', e)
         except Exception as e:
@@ -111,7 +165,27 @@ def cli_loop(manager: ProjectManager):
 
 if __name__ == '__main__':
     manager = ProjectManager()
-    print('ToDoList - in-memory version')
+    if SNAPSHOT_PATH:
+        try:
+            check_writable(SNAPSHOT_PATH)
+            if os.path.exists(SNAPSHOT_PATH):
+                manager = ProjectManager.load(SNAPSHOT_PATH)
+        except (ToDoError, OSError) as e:
+            print('Error:', e)
+            sys.exit(1)
+    if SNAPSHOT_PATH:
+        print(f'ToDoList - snapshot: {SNAPSHOT_PATH}')
+    else:
+        print('ToDoList - in-memory version')
     print(f'MAX_NUMBER_OF_PROJECTS = {MAX_NUMBER_OF_PROJECTS}')
     print(f'MAX_NUMBER_OF_TASKS_PER_PROJECT = {MAX_NUMBER_OF_TASKS_PER_PROJECT}')
-    cli_loop(manager)
+    try:
+        cli_loop(manager)
+    finally:
+        # Save on every way out (menu exit, EOF, Ctrl-C), not just option 10.
+        if SNAPSHOT_PATH:
+            try:
+                manager.save(SNAPSHOT_PATH)
+                print(f'Saved to {SNAPSHOT_PATH}.')
+            except OSError as e:
+                print('Error:', e)
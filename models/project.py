@@ -1,38 +1,42 @@
-import os
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Optional
 from exceptions import ToDoError
 from models.task import Task
-from dotenv import load_dotenv
+from config import MAX_NUMBER_OF_TASKS_PER_PROJECT
 
-# Load environment variables
-load_dotenv()
-MAX_NUMBER_OF_TASKS_PER_PROJECT = int(os.getenv('MAX_NUMBER_OF_TASKS_PER_PROJECT'))
-
-@dataclass
+@dataclass(slots=True)
 class Project:
     name: str
     description: Optional[str] = ''
-    tasks: List[Task] = field(default_factory=list)
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    # Keyed by task title; dicts keep insertion order for listing.
+    tasks: Dict[str, Task] = field(default_factory=dict)
+    # Nanoseconds since the epoch (UTC); formatted only when displayed.
+    created_at: int = field(default_factory=time.time_ns)
 
     def add_task(self, task: Task):
         if len(self.tasks) >= MAX_NUMBER_OF_TASKS_PER_PROJECT:
             raise ToDoError(f"Maximum tasks per project: {MAX_NUMBER_OF_TASKS_PER_PROJECT}")
-        if any(t.title == task.title for t in self.tasks):
+        if task.title in self.tasks:
             raise ToDoError("Task title already exists in this project.")
-        self.tasks.append(task)
+        self.tasks[task.title] = task
 
     def remove_task(self, task_title: str):
-        for i, t in enumerate(self.tasks):
-            if t.title == task_title:
-                del self.tasks[i]
-                return
-        raise ToDoError("Task not found.")
+        if self.tasks.pop(task_title, None) is None:
+            raise ToDoError("Task not found.")
 
     def get_task(self, task_title: str) -> Task:
-        for t in self.tasks:
-            if t.title == task_title:
-                return t
-        raise ToDoError("Task not found.")
+        task = self.tasks.get(task_title)
+        if task is None:
+            raise ToDoError("Task not found.")
+        return task
+
+    def rename_task(self, task_title: str, new_title: str):
+        task = self.get_task(task_title)
+        if new_title == task_title:
+            return
+        if new_title in self.tasks:
+            raise ToDoError("Task title already exists in this project.")
+        task.title = new_title
+        # Rebuild so the renamed task keeps its place in the listing.
+        self.tasks = {(new_title if k == task_title else k): t for k, t in self.tasks.items()}
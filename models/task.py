@@ -1,17 +1,40 @@
+import re
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from exceptions import ToDoError
 
-@dataclass
+VALID_STATUSES = frozenset({sys.intern('todo'), sys.intern('doing'), sys.intern('done')})
+
+_DEADLINE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
+def is_valid_deadline(deadline: str) -> bool:
+    m = _DEADLINE_RE.fullmatch(deadline)
+    if not m:
+        return False
+    year, month, day = map(int, m.groups())
+    if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= 31):
+        return False
+    if day > 28:
+        # Only late days can fall outside a month; let datetime check those.
+        try:
+            datetime(year, month, day)
+        except ValueError:
+            return False
+    return True
+
+@dataclass(slots=True)
 class Task:
     title: str
     description: Optional[str] = ''
     status: str = 'todo'
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    # Nanoseconds since the epoch (UTC); formatted only when displayed.
+    created_at: int = field(default_factory=time.time_ns)
     deadline: str = ''
 
     def mark_status(self, new_status: str):
-        if new_status not in ('todo', 'doing', 'done'):
+        if new_status not in VALID_STATUSES:
             raise ToDoError("Invalid status. Must be todo|doing|done.")
-        self.status = new_status
+        self.status = sys.intern(new_status)
@@ -0,0 +1,121 @@
+import os
+import pickle
+import sys
+from dataclasses import asdict
+from typing import Dict
+from exceptions import ToDoError
+from models.project import Project
+from models.task import Task, VALID_STATUSES, is_valid_deadline
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+_MISSING = object()
+
+def _dumps_json(obj) -> bytes:
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly, no separate encode pass.
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8')
+
+def _loads_json(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _is_json(path: str) -> bool:
+    return path.endswith('.json')
+
+def atomic_write(path: str, data: bytes):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    # Atomic on POSIX and Windows, so a crash never leaves a torn snapshot.
+    os.replace(tmp_path, path)
+
+def check_writable(path: str):
+    # Fail at startup rather than losing a whole session when the exit save can't be written.
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        raise ToDoError(f"Snapshot directory does not exist: {directory}")
+    if not os.access(directory, os.W_OK):
+        raise ToDoError(f"Snapshot directory is not writable: {directory}")
+
+def dump_projects(projects: Dict[str, Project], path: str):
+    if _is_json(path):
+        data = _dumps_json([
+            {
+                'name': p.name,
+                'description': p.description,
+                'created_at': p.created_at,
+                'tasks': [asdict(t) for t in p.tasks.values()],
+            }
+            for p in projects.values()
+        ])
+    else:
+        data = pickle.dumps(projects, protocol=pickle.HIGHEST_PROTOCOL)
+    atomic_write(path, data)
+
+def _require(record: dict, key: str, kind: type, where: str):
+    value = record.get(key, _MISSING) if isinstance(record, dict) else _MISSING
+    # bool is an int subclass; a hand-edited true/false is never a valid field.
+    if value is _MISSING or not isinstance(value, kind) or isinstance(value, bool):
+        raise ToDoError(f"Malformed JSON snapshot: {where} needs {kind.__name__} {key!r}.")
+    return value
+
+def _task_from_json(t, where: str) -> Task:
+    title = _require(t, 'title', str, where)
+    where = f"{where} task {title!r}"
+    status = _require(t, 'status', str, where)
+    if status not in VALID_STATUSES:
+        raise ToDoError(f"Malformed JSON snapshot: {where} has invalid status {status!r}.")
+    deadline = _require(t, 'deadline', str, where)
+    if not is_valid_deadline(deadline):
+        raise ToDoError(f"Malformed JSON snapshot: {where} has invalid deadline {deadline!r}.")
+    return Task(
+        title=title, description=_require(t, 'description', str, where), status=sys.intern(status),
+        created_at=_require(t, 'created_at', int, where), deadline=deadline)
+
+def _project_from_json(p) -> Project:
+    name = _require(p, 'name', str, 'project')
+    where = f"project {name!r}"
+    raw_tasks = _require(p, 'tasks', list, where)
+    tasks: Dict[str, Task] = {}
+    for t in raw_tasks:
+        task = _task_from_json(t, where)
+        if task.title in tasks:
+            raise ToDoError(f"Malformed JSON snapshot: {where} has duplicate task {task.title!r}.")
+        tasks[task.title] = task
+    return Project(
+        name=name, description=_require(p, 'description', str, where),
+        created_at=_require(p, 'created_at', int, where), tasks=tasks)
+
+def load_projects(path: str) -> Dict[str, Project]:
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not _is_json(path):
+        # Unpickling runs arbitrary code: only load snapshots you wrote yourself.
+        try:
+            projects = pickle.loads(data)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError,
+                ValueError, TypeError) as e:
+            raise ToDoError(f"Malformed pickle snapshot: {e!r}")
+        if not isinstance(projects, dict):
+            raise ToDoError("Snapshot does not contain a project mapping.")
+        return projects
+    try:
+        records = _loads_json(data)
+    except ValueError as e:
+        raise ToDoError(f"Malformed JSON snapshot: {e}")
+    if not isinstance(records, list):
+        raise ToDoError("Malformed JSON snapshot: expected a list of projects.")
+    projects: Dict[str, Project] = {}
+    for p in records:
+        proj = _project_from_json(p)
+        if proj.name in projects:
+            raise ToDoError(f"Malformed JSON snapshot: duplicate project {proj.name!r}.")
+        projects[proj.name] = proj
+    return projects
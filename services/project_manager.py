@@ -1,22 +1,41 @@
-import os
+import sys
 from typing import Dict, List, Optional
-from datetime import datetime
 from exceptions import ToDoError
 from models.project import Project
-from models.task import Task
-from dotenv import load_dotenv
+from models.task import Task, VALID_STATUSES, is_valid_deadline
+from persistence import dump_projects, load_projects
+from config import MAX_NUMBER_OF_PROJECTS, MAX_NUMBER_OF_TASKS_PER_PROJECT
 
-# Load env vars
-load_dotenv()
-MAX_NUMBER_OF_PROJECTS = int(os.getenv('MAX_NUMBER_OF_PROJECTS'))
+_MISSING = object()
 
 class ProjectManager:
     def __init__(self):
         self.projects: Dict[str, Project] = {}
 
+    # --- Persistence ---
+    def save(self, path: str):
+        # Paths ending in .json are written as JSON, anything else is pickled.
+        dump_projects(self.projects, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'ProjectManager':
+        manager = cls()
+        manager.projects = load_projects(path)
+        manager.check_limits()
+        return manager
+
+    def check_limits(self):
+        if len(self.projects) > MAX_NUMBER_OF_PROJECTS:
+            raise ToDoError(f"Snapshot exceeds maximum number of projects: {MAX_NUMBER_OF_PROJECTS}")
+        for proj in self.projects.values():
+            if len(proj.tasks) > MAX_NUMBER_OF_TASKS_PER_PROJECT:
+                raise ToDoError(
+                    f"Project {proj.name!r} exceeds maximum tasks per project: {MAX_NUMBER_OF_TASKS_PER_PROJECT}")
+
     # --- Project operations ---
     def create_project(self, name: str, description: str = '') -> Project:
-        if not name or not name.strip():
+        name = name.strip()
+        if not name:
             raise ToDoError("Project name cannot be empty.")
         if len(self.projects) >= MAX_NUMBER_OF_PROJECTS:
             raise ToDoError(f"Maximum number of projects: {MAX_NUMBER_OF_PROJECTS}")
@@ -27,22 +46,20 @@ class ProjectManager:
         return proj
 
     def delete_project(self, name: str):
-        if name not in self.projects:
+        if self.projects.pop(name, _MISSING) is _MISSING:
             raise ToDoError("Project not found.")
-        del self.projects[name]
 
     def list_projects(self) -> List[Project]:
         return list(self.projects.values())
 
     def get_project(self, name: str) -> Project:
-        if name not in self.projects:
+        proj = self.projects.get(name, _MISSING)
+        if proj is _MISSING:
             raise ToDoError("Project not found.")
-        return self.projects[name]
+        return proj
 
     def update_project(self, current_name: str, new_name: Optional[str] = None, new_description: Optional[str] = None):
-        if current_name not in self.projects:
-            raise ToDoError("Project not found.")
-        proj = self.projects[current_name]
+        proj = self.get_project(current_name)
 
         if new_name is not None:
             clean_new = new_name.strip()
@@ -61,21 +78,21 @@ class ProjectManager:
     # --- Task operations ---
     def add_task_to_project(self, project_name: str, title: str, description: str, deadline: str, status: str = 'todo') -> Task:
         proj = self.get_project(project_name)
-        if not title.strip():
+        title = title.strip()
+        deadline = deadline.strip()
+        if not title:
             raise ToDoError("Task title cannot be empty.")
         if len(title) > 30:
             raise ToDoError("Title must be less than 30 characters.")
         if len(description) > 150:
             raise ToDoError("Description must be less than 150 characters.")
-        if not deadline.strip():
+        if not deadline:
             raise ToDoError("Deadline is required and must be YYYY-MM-DD.")
-        try:
-            datetime.strptime(deadline, '%Y-%m-%d')
-        except ValueError:
-            raise ToDoError("Invalid deadline. Must be YYYY-MM-DD.")
-        if status not in ('todo', 'doing', 'done'):
+        if not is_valid_deadline(deadline):
+            raise ToDoError("Invalid deadline. Must be zero-padded YYYY-MM-DD (e.g. 2024-01-05).")
+        if status not in VALID_STATUSES:
             raise ToDoError("Invalid status. Must be todo|doing|done.")
-        task = Task(title=title, description=description, status=status, deadline=deadline)
+        task = Task(title=title, description=description, status=sys.intern(status), deadline=deadline)
         proj.add_task(task)
         return task
 
@@ -86,16 +103,34 @@ class ProjectManager:
     def update_task(self, project_name: str, task_title: str, new_title: Optional[str] = None,
                     new_description: Optional[str] = None, new_deadline: Optional[str] = None,
                     new_status: Optional[str] = None):
-        task = self.get_project(project_name).get_task(task_title)
+        self.update_task_on(self.get_project(project_name), task_title, new_title=new_title,
+                            new_description=new_description, new_deadline=new_deadline,
+                            new_status=new_status)
+
+    def update_task_on(self, proj: Project, task_title: str, new_title: Optional[str] = None,
+                       new_description: Optional[str] = None, new_deadline: Optional[str] = None,
+                       new_status: Optional[str] = None):
+        task = proj.get_task(task_title)
+        # Validate every field before touching the task so a bad value leaves it unchanged.
+        clean_title = None
         if new_title:
-            task.title = new_title.strip()
+            clean_title = new_title.strip()
+            if not clean_title:
+                raise ToDoError("Task title cannot be empty.")
+            if clean_title != task_title and clean_title in proj.tasks:
+                raise ToDoError("Task title already exists in this project.")
+        if new_deadline is not None:
+            new_deadline = new_deadline.strip()
+            if not is_valid_deadline(new_deadline):
+                raise ToDoError("Invalid deadline format. Must be zero-padded YYYY-MM-DD (e.g. 2024-01-05).")
+        if new_status and new_status not in VALID_STATUSES:
+            raise ToDoError("Invalid status. Must be todo|doing|done.")
+
+        if clean_title is not None:
+            proj.rename_task(task_title, clean_title)
         if new_description is not None:
             task.description = new_description
         if new_deadline is not None:
-            try:
-                datetime.strptime(new_deadline, '%Y-%m-%d')
-                task.deadline = new_deadline
-            except ValueError:
-                raise ToDoError("Invalid deadline format. Must be YYYY-MM-DD.")
+            task.deadline = new_deadline
         if new_status:
-            task.mark_status(new_status)
+            task.status = sys.intern(new_status)